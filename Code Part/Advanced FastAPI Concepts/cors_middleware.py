@@ -1,17 +1,57 @@
+import re
+from urllib.parse import urlsplit
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI()
 
+ALLOWED_ORIGINS = [
+    "http://my-frontend.com",
+    "http://localhost:3000",
+]
+# Any subdomain of these is allowed too, with the same scheme and port, e.g. http://app.my-frontend.com
+ALLOWED_ORIGIN_DOMAINS = [
+    "http://my-frontend.com",
+]
+
+# One regex for all wildcard domains, built once here instead of matching patterns per request.
+# Origins are case-sensitive (RFC 6454), so subdomain labels must be lowercase and there's no IGNORECASE.
+def subdomain_pattern(origin: str) -> str:
+    scheme, netloc = urlsplit(origin)[:2]
+    return re.escape(scheme) + r"://(?:[a-z0-9-]+\.)+" + re.escape(netloc)
+
+ALLOWED_ORIGIN_REGEX = "|".join(map(subdomain_pattern, ALLOWED_ORIGIN_DOMAINS))
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    # CORS runs on every request, so turn the origin and method lists into sets once at init.
+    # Starlette already builds the Access-Control-Allow-Methods header string in __init__.
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        # Exact origins are a set lookup; only fall back to the regex for wildcard subdomains
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+        return self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin) is not None
+
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-            "http://my-frontend.com",
-            "http://localhost:3000",
-        ],  # Allows all origins
+    FastCORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_origin_regex=ALLOWED_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods = ['GET', 'POST', 'PUT', 'DELETE'],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
 
 # Define endpoints
+
+
+'''
+Command to run the application:
+uvicorn cors_middleware:app --reload --loop uvloop --http httptools
+With gunicorn: gunicorn cors_middleware:app -k uvicorn.workers.UvicornWorker
+'''
@@ -1,24 +1,60 @@
+import os
+import queue
+import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from time import perf_counter_ns
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+# Log through a queue so requests never wait on writing to the console; LOG_LEVEL can be set per environment
+# QueueHandler formats on the calling thread, so keep it to the bare message to avoid double prefixes
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[queue_handler])
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+
+# Only log requests slower than this, so fast requests don't pay for logging at all
+SLOW_REQUEST_THRESHOLD_MS = 100
 
 class TimerMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        import time
-        start_time = time.time()
+        start_time = perf_counter_ns()
         response = await call_next(request)
-        duration = time.time() - start_time
-        print(f"Request:{request.url.path} processed in {duration:.5f} seconds")
+        duration_ms = (perf_counter_ns() - start_time) / 1_000_000
+        if duration_ms > SLOW_REQUEST_THRESHOLD_MS:
+            logger.warning("Slow request:%s processed in %.3f ms", request.url.path, duration_ms)
         return response
 
 
 app.add_middleware(TimerMiddleware)
 
 
-@app.get("/hello")
-async def hello():
+@app.on_event("shutdown")
+def stop_log_listener():
+    log_listener.stop()
+
+
+def simulate_work():
     for _ in range(1000000):
         pass
+
+
+@app.get("/hello")
+async def hello():
+    # Run the CPU-bound loop in a worker thread so it doesn't block the event loop
+    await asyncio.to_thread(simulate_work)
     return {"message": "Hello, World!"}
+
+
+'''
+Command to run the application:
+uvicorn custom-middleware:app --reload --loop uvloop --http httptools
+'''
@@ -1,10 +1,19 @@
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Dependency Functions/Injection
+class MockDBConnection:
+    def __init__(self):
+        self.connection = "mock_db_connection"
+
+    def close(self):
+        pass  # A real connection would be released here
+
+
 def get_db():
-    db = {"connection to db": "mock_db_connection"}
+    db = MockDBConnection()
     try:
         yield db
     finally:
@@ -14,5 +23,5 @@ def get_db():
 
 # Endpoints
 @app.get("/home")
-def home(db = Depends(get_db)): # Dependency Injection Code is used here
-    return {"db_status": db['connection']}
\ No newline at end of file
+async def home(db = Depends(get_db)): # Dependency Injection Code is used here
+    return {"db_status": db.connection}
\ No newline at end of file
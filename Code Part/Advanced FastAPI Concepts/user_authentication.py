@@ -1,7 +1,8 @@
 from fastapi import FastAPI, Depends, Form, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 
 
@@ -21,12 +22,12 @@ def decode_token(token: str):
     )
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     return decode_token(token)
 
 
 @app.get('/profile')
-def get_profile(user=Depends(get_current_user)):
+async def get_profile(user=Depends(get_current_user)):
     return {'username': user['name']}
 
 
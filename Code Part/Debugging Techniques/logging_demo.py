@@ -1,19 +1,40 @@
+import os
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] (line %(lineno)d) - %(levelname)s - %(message)s",
+# Set LOG_LEVEL=WARNING in production so the info() calls below are dropped at the level check
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Request handlers only put records on a queue; a background thread writes them to stderr.
+# QueueHandler formats the message on the calling thread, so it only gets %(message)s and the
+# listener's handler adds the timestamp and level.
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter(
+    fmt="[%(asctime)s] - %(levelname)s - %(message)s",
     datefmt="%m-%d-%Y %H:%M:%S"
-)
+))
+logging.basicConfig(level=LOG_LEVEL, handlers=[queue_handler])
+log_listener = QueueListener(log_queue, stream_handler)
+log_listener.start()
+
+
+@app.on_event("shutdown")
+def stop_log_listener():
+    log_listener.stop()  # Flushes any records still in the queue
 
 
 
 @app.get("/debug")
-def debug_route():
+async def debug_route():
     logging.info("Debug endpoint was called.")
     logging.info("This is an info message.")
     return {"message": "Check the logs for debug information."}
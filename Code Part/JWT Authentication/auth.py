@@ -1,29 +1,39 @@
-from datetime import datetime, timedelta, timezone
-from authlib.jose import JoseError, jwt
+import time
+from functools import lru_cache
+import jwt
 from fastapi import HTTPException
 
 # constants
 SECRET_KEY = 'my_secret'
 ALGORITHM = 'HS256'
 ACCESS_TOKEN_EXPIRY_MINUTES = 30
+ACCESS_TOKEN_EXPIRY_SECONDS = ACCESS_TOKEN_EXPIRY_MINUTES * 60
 
 
 # functions
 def create_access_token(data: dict):
-    header = {'alg': ALGORITHM}
-    expire = datetime.now(timezone.utc) + timedelta(ACCESS_TOKEN_EXPIRY_MINUTES)
     payload = data.copy()
-    payload.update({'exp': expire})
-    return jwt.encode(header, payload, SECRET_KEY).decode('utf-8')
+    payload.update({'exp': int(time.time()) + ACCESS_TOKEN_EXPIRY_SECONDS})
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+
+# Tokens are immutable, so the signature check only has to run once per token.
+# Expiry is not checked here since it changes over time; verify_token checks it on every call.
+@lru_cache(maxsize=4096)
+def decode_token(token: str) -> dict:
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={'verify_exp': False})
 
 
 def verify_token(token: str):
     try:
-        claims = jwt.decode(token, SECRET_KEY)
-        claims.validate()
-        username = claims.get('sub')
-        if username is None:
-            raise HTTPException(status_code=401, detail='Token missing')
-        return username
-    except JoseError:
-        raise HTTPException(status_code=401, detail="Couldn't Validate Credentials")
\ No newline at end of file
+        claims = decode_token(token)
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Couldn't Validate Credentials")
+    exp = claims.get('exp')
+    # verify_exp=False also skips PyJWT's type check, so reject non-numeric exp here
+    if exp is not None and (not isinstance(exp, (int, float)) or exp < time.time()):
+        raise HTTPException(status_code=401, detail="Couldn't Validate Credentials")
+    username = claims.get('sub')
+    if username is None:
+        raise HTTPException(status_code=401, detail='Token missing')
+    return username
@@ -1,10 +1,11 @@
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from auth import create_access_token, verify_token
 from models import UserInDB
 from utils import get_user, verify_password
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 
 
@@ -21,7 +22,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()):
 
 
 @app.get('/users')
-def read_users(token: str = Depends(oauth2_scheme)):
+async def read_users(token: str = Depends(oauth2_scheme)):
     username = verify_token(token)
     return {'username': username}
 
@@ -29,4 +30,10 @@ def read_users(token: str = Depends(oauth2_scheme)):
 '''
 username = johndoe
 password = secret123
-'''
\ No newline at end of file
+'''
+
+
+'''
+Command to run the application:
+uvicorn main:app --reload --loop uvloop --http httptools
+'''
@@ -1,9 +1,20 @@
 # This file contains utility functions for JWT authentication.
 # It is just collection of helper functions that can be used in various parts of the application.
 
+import hashlib
+import threading
+from collections import OrderedDict
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 10 bcrypt rounds instead of the default 12 keeps hashing ~4x cheaper for this dev setup
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
+
+# Remembers (sha256 of password, bcrypt hash) pairs that already verified, so repeat logins skip bcrypt.
+# The raw password is never stored.
+VERIFIED_CACHE_SIZE = 1024
+verified_passwords = OrderedDict()
+# /token is a sync endpoint, so this runs on many threadpool threads at once
+verified_passwords_lock = threading.Lock()
 
 fake_user_db = {
     'johndoe': {
@@ -18,7 +29,19 @@ def get_user(username: str):
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    key = (hashlib.sha256(plain_password.encode()).hexdigest(), hashed_password)
+    with verified_passwords_lock:
+        if key in verified_passwords:
+            verified_passwords.move_to_end(key)
+            return True
+    # bcrypt runs outside the lock so other logins aren't serialized behind it
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+    with verified_passwords_lock:
+        verified_passwords[key] = True
+        if len(verified_passwords) > VERIFIED_CACHE_SIZE:
+            verified_passwords.popitem(last=False)
+    return True
 
 
 def hash_password(password: str) -> str:
@@ -1,36 +1,44 @@
 # Contains all logic for all api endpoints
 from fastapi import FastAPI
+# ORJSONResponse targets the FastAPI versions this repo was written against;
+# recent FastAPI releases deprecate it and emit FastAPIDeprecationWarning when these routes run
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 from schemas import InputSchema, OutputSchema
-from predict import make_prediction, make_batch_predictions
+from predict import FEATURES, load_model, make_prediction, make_batch_predictions
 from typing import List
 import pandas as pd  # Add this import at the top
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+# Compresses responses larger than 500 bytes (e.g. /predict_batch), small ones are sent as is
+
+@app.on_event("startup")
+async def load_and_warm_up_model():
+    # Runs once in every worker process
+    load_model()
+    # Run one dummy prediction so the first real request doesn't pay the numpy/BLAS setup cost
+    make_batch_predictions([dict.fromkeys(FEATURES, 0.0)])
 
 @app.get("/")
-def index():
+async def index():
     return {"message": "Welcome to the ML Prediction API"}
 
-@app.post("/prediction", response_model=OutputSchema)
-def predict(user_input: InputSchema):
+@app.post("/prediction", responses={200: {"model": OutputSchema}})
+async def predict(user_input: InputSchema):
     prediction = make_prediction(user_input.model_dump())
-    # Convert to Python float to avoid JSON serialization issues
-    prediction_value = float(prediction) if hasattr(prediction, 'item') else float(prediction)
-    # Fix field name to match OutputSchema - should be 'prediction' not 'predicted_price'
-    return OutputSchema(prediction=round(prediction_value, 2))
+    # Predictions are trusted floats, so skip response_model re-validation and serialize directly.
+    # OutputSchema is only listed in `responses` to keep it in the OpenAPI docs.
+    return ORJSONResponse({"prediction": round(prediction, 2)})
 
 
 
 
-@app.post("/predict_batch", response_model=List[OutputSchema])
-def predict_batch(user_inputs: List[InputSchema]):
-    # Use the same logic as single prediction for each item in the batch
-    predictions = []
-    for user_input in user_inputs:
-        prediction = make_prediction(user_input.model_dump())
-        prediction_value = float(prediction) if hasattr(prediction, 'item') else float(prediction)
-        predictions.append(OutputSchema(prediction=round(prediction_value, 2)))
-    return predictions
+@app.post("/predict_batch", responses={200: {"model": List[OutputSchema]}})
+async def predict_batch(user_inputs: List[InputSchema]):
+    # Predict the whole batch with a single model call
+    predictions = make_batch_predictions([user_input.model_dump() for user_input in user_inputs])
+    return ORJSONResponse([{"prediction": prediction} for prediction in predictions.round(2).tolist()])
 
 
 
@@ -90,4 +98,10 @@ Example JSON input for testing the /prediction endpoint:
   }
 ]
 
-'''
\ No newline at end of file
+'''
+
+'''
+Command to run the application:
+uvicorn main:app --reload --loop uvloop --http httptools
+With one worker per CPU core: uvicorn main:app --workers $(nproc) --loop uvloop --http httptools
+'''
@@ -4,24 +4,39 @@ import joblib
 import numpy as np
 from typing import List
 
-# Load the trained model from the file
-saved_model = joblib.load('model.joblib')
-print("Loaded the model from model.joblib")
+# Feature order used while training the model (see train.py)
+FEATURES = (
+    'longitude',
+    'latitude',
+    'housing_median_age',
+    'total_rooms',
+    'total_bedrooms',
+    'population',
+    'households',
+    'median_income'
+)
+
+# Set by load_model(), which main.py calls from its startup hook.
+# That way each worker loads the model after it starts, not when the module is imported.
+saved_model = None
+_coef = None
+_intercept = None
+
+def load_model():
+    global saved_model, _coef, _intercept
+    # Load the trained model from the file
+    # mmap_mode='r' maps the numpy arrays read-only, so worker processes share them instead of each keeping a copy
+    saved_model = joblib.load('model.joblib', mmap_mode='r')
+    print("Loaded the model from model.joblib")
+    # LinearRegression is just X @ coef_ + intercept_, so do the dot product directly
+    # instead of going through sklearn's predict() checks.
+    # Stay in float64: the feature terms are ~5e6 and cancel against the intercept, so float32 loses precision
+    _coef = np.asarray(saved_model.coef_, dtype=np.float64)
+    _intercept = float(saved_model.intercept_)
 
 def make_prediction(data: dict) -> float:
-    features = np.array([
-        [
-            data['longitude'],
-            data['latitude'],
-            data['housing_median_age'],
-            data['total_rooms'],
-            data['total_bedrooms'],
-            data['population'],
-            data['households'],
-            data['median_income']
-        ]
-    ])
-    return saved_model.predict(features)[0]
+    features = np.array([data[feature] for feature in FEATURES], dtype=np.float64)
+    return float(features @ _coef + _intercept)
 
 
 # def make_batch_predictions(data_list: List[dict]) -> List[float]:
@@ -33,17 +48,13 @@ def make_prediction(data: dict) -> float:
 
 
 def make_batch_predictions(data_list: List[dict]) -> np.array:
-    x = np.array([
-        [
-            x['latitude'],
-            x['housing_median_age'],
-            x['total_rooms'],
-            x['total_bedrooms'],
-            x['population'],
-            x['longitude'],
-            x['households'],
-            x['median_income']
-        ]
-        for x in data_list
-    ])
-    return saved_model.predict(x)
\ No newline at end of file
+    if not data_list:
+        return np.empty(0)
+    # Build the whole (n, 8) feature matrix in one pass, in the same column order as train.py,
+    # so the weights are applied to the whole batch in one matmul
+    x = np.fromiter(
+        (data[feature] for data in data_list for feature in FEATURES),
+        dtype=np.float64,
+        count=len(data_list) * len(FEATURES)
+    ).reshape(-1, len(FEATURES))
+    return x @ _coef + _intercept
@@ -1,5 +1,7 @@
 import os
 import time
+import random
+import asyncio
 import cProfile
 import datetime
 from fastapi import FastAPI, Request
@@ -8,11 +10,17 @@ from fastapi.responses import JSONResponse
 PROFILES_DIR = 'profiles'
 os.makedirs(PROFILES_DIR, exist_ok=True)
 
+# Fraction of requests to profile, e.g. PROFILE_SAMPLE_RATE=1 to profile every request
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0.001'))
+
 app = FastAPI()
 
 
 @app.middleware('http')
 async def create_profile(request: Request, call_next):
+    if random.random() >= PROFILE_SAMPLE_RATE:
+        return await call_next(request)
+
     time_stamp = datetime.datetime.now().strftime('%m_%d_%Y_%H_%M_%S_%f')
     path = request.url.path.strip('/').replace('/', '_') or 'root'
     profile_name = os.path.join(PROFILES_DIR, f'{path}_{time_stamp}.prof')
@@ -23,7 +31,7 @@ async def create_profile(request: Request, call_next):
     response = await call_next(request)
 
     profiler.disable()
-    profiler.dump_stats(profile_name)
+    await asyncio.to_thread(profiler.dump_stats, profile_name)
 
     print(f'Profile saved: {profile_name}')
     return response
@@ -42,7 +50,7 @@ async def compute():
 
 
 """
-Here the middleware `create_profile` uses `cProfile` to profile each incoming request. The profiling data is saved to a file in the `profiles` directory, with filenames based on the request path and timestamp. The application includes two endpoints: a root endpoint and a `/compute` endpoint that simulates some computation by sleeping for 1 second and then performing a sum operation.
+Here the middleware `create_profile` uses `cProfile` to profile a sample of incoming requests (`PROFILE_SAMPLE_RATE`, 0.1% by default). The profiling data is saved to a file in the `profiles` directory, with filenames based on the request path and timestamp. The application includes two endpoints: a root endpoint and a `/compute` endpoint that simulates some computation by sleeping for 1 second and then performing a sum operation.
 """
 
 '''
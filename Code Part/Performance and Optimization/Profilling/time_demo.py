@@ -4,7 +4,7 @@ from fastapi import FastAPI, Request
 
 logging.basicConfig(
     level=logging.INFO,
-    format="[%(asctime)s] (line %(lineno)d) - %(levelname)s - %(message)s",
+    format="[%(asctime)s] - %(levelname)s - %(message)s",
     datefmt="%m-%d-%Y %H:%M:%S"
 )
 logger = logging.getLogger('profiler')
@@ -21,6 +21,6 @@ def predict(data: InputData):
 
 '''
 Command to run this app:
-uvicorn main:app --reload
+uvicorn main:app --reload --loop uvloop --http httptools
 For loctust testing, run: locust
 '''
\ No newline at end of file
@@ -3,7 +3,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 app = FastAPI()
 
-Instrumentator().instrument(app).expose(app)
+Instrumentator(should_group_status_codes=False).instrument(app).expose(app)
 
 
 @app.get('/home')
@@ -12,6 +12,8 @@ def home():
 
 '''
 Command to run the application:
-uvicorn prometheus-setup:app --reload
+uvicorn prometheus-setup:app --reload --loop uvloop --http httptools
+With one worker per CPU core (metrics from all workers are merged through PROMETHEUS_MULTIPROC_DIR):
+rm -rf /tmp/prometheus && mkdir -p /tmp/prometheus && PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus uvicorn prometheus-setup:app --workers $(nproc) --loop uvloop --http httptools
 Also visit : http://127.0.0.1:8000/metrics
 '''
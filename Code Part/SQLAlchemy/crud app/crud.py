@@ -1,8 +1,14 @@
 from sqlalchemy.orm import Session
 import models,schemas
 
-def get_employees(db: Session):
-    return db.query(models.Employee).all()
+def get_employees(db: Session, skip: int = 0, limit: int = 100, last_id: int | None = None):
+    query = db.query(models.Employee).order_by(models.Employee.id)
+    if last_id is not None:
+        # Keyset pagination: seek past the last seen id instead of scanning `skip` rows
+        query = query.filter(models.Employee.id > last_id)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 def get_employee_by_id(db: Session, emp_id: int):
     return (
@@ -23,26 +29,14 @@ def create_employee(db: Session, employee: schemas.EmployeeCreate):
     return db_employee
 
 
-def update_employee(db: Session, emp_id: int, employee: schemas.EmployeeUpdate):
-    db_employee = (
-        db.query(models.Employee)
-        .filter(models.Employee.id == emp_id)
-        .first()
-    )
-    if db_employee:
-        db_employee.name = employee.name
-        db_employee.email = employee.email
-        db.commit()
-        db.refresh(db_employee)
+# update/delete take the employee already fetched by the endpoint, so it isn't queried again
+def update_employee(db: Session, db_employee: models.Employee, employee: schemas.EmployeeUpdate):
+    db_employee.name = employee.name
+    db_employee.email = employee.email
+    db.commit() # No refresh: the new values were just set, and the session doesn't expire them on commit
     return db_employee
 
-def delete_employee(db: Session, emp_id: int):
-    db_employee = (
-        db.query(models.Employee)
-        .filter(models.Employee.id == emp_id)
-        .first()
-    )
-    if db_employee:
-        db.delete(db_employee)
-        db.commit()
-    return db_employee # Return the deleted employee or None if not found
+def delete_employee(db: Session, db_employee: models.Employee):
+    db.delete(db_employee)
+    db.commit()
+    return db_employee # Return the deleted employee
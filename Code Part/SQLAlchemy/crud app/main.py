@@ -1,11 +1,25 @@
 import models, schemas, crud
+from anyio import to_thread
 from fastapi import FastAPI, Depends, HTTPException
+from starlette.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
 from database import engine, SessionLocal, Base
 
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=500)
+# Compresses the larger responses such as the /employees/ list (up to `limit` rows)
+
+# Sync endpoints run on AnyIO's threadpool (40 threads by default).
+# They stay sync because SQLAlchemy here is blocking, so give the pool more room instead.
+THREADPOOL_SIZE = 100
+
+
+@app.on_event("startup")
+def increase_threadpool_size():
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
 
 # Dependency to get DB session
 def get_db():
@@ -23,8 +37,8 @@ def create_employee(employee: schemas.EmployeeCreate, db: Session = Depends(get_
 
 # 2. Get all employees
 @app.get("/employees/", response_model=list[schemas.EmployeeOut])
-def read_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_employees(db)
+def read_employees(skip: int = 0, limit: int = 100, last_id: int | None = None, db: Session = Depends(get_db)):
+    return crud.get_employees(db, skip=skip, limit=limit, last_id=last_id)
 
 # 3. Get an employee by ID
 @app.get("/employees/{employee_id}", response_model=schemas.EmployeeOut)
@@ -41,7 +55,7 @@ def update_employee(employee_id: int, employee: schemas.EmployeeUpdate, db: Sess
     db_employee = crud.get_employee_by_id(db, employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return crud.update_employee(db, employee_id, employee)
+    return crud.update_employee(db, db_employee, employee)
 
 # 5. Delete an employee
 @app.delete("/employees/{employee_id}")
@@ -49,5 +63,12 @@ def delete_employee(employee_id: int, db: Session = Depends(get_db)):
     db_employee = crud.get_employee_by_id(db, employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
-    crud.delete_employee(db, employee_id)
-    return {"detail": "Employee deleted"}
\ No newline at end of file
+    crud.delete_employee(db, db_employee)
+    return {"detail": "Employee deleted"}
+
+
+
+'''
+Command to run the application:
+uvicorn main:app --reload --loop uvloop --http httptools
+'''
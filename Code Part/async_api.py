@@ -1,9 +1,16 @@
 import asyncio
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/wait")
 async def wait():
     await asyncio.sleep(3)  # Simulate an async operation
-    return {"message": "This is an async endpoint"}
\ No newline at end of file
+    return {"message": "This is an async endpoint"}
+
+
+'''
+Command to run the application:
+uvicorn async_api:app --reload --loop uvloop --http httptools
+'''
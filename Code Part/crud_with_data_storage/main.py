@@ -1,7 +1,10 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from starlette.middleware.gzip import GZipMiddleware
 from models import Employee
-from typing import List
-import json
+from typing import Dict, List
+import time
+import asyncio
+import orjson
 import os
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "./employees_db.json")
@@ -9,62 +12,110 @@ DB_PATH = os.path.join(os.path.dirname(__file__), "./employees_db.json")
 def load_employees():
     if not os.path.exists(DB_PATH):
         return []
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(DB_PATH, "rb") as f:
+        data = orjson.loads(f.read())
     return [Employee(**emp) for emp in data]
 
-def save_employees(employees: List[Employee]):
-    with open(DB_PATH, "w", encoding="utf-8") as f:
-        json.dump([emp.dict() for emp in employees], f, indent=4)
+def write_employees(data: bytes):
+    with open(DB_PATH, "wb") as f:
+        f.write(data)
 
-employees_db: List[Employee] = load_employees()
+# Changes are flushed at most once per FLUSH_DELAY_SECONDS: a burst of writes becomes one file write
+FLUSH_DELAY_SECONDS = 1.0
+unsaved_changes = False
+flush_task = None
+
+def save_employees():
+    # Mark the data dirty and make sure a flush task is running; the request doesn't wait on disk
+    global unsaved_changes, flush_task
+    unsaved_changes = True
+    if flush_task is None or flush_task.done():
+        flush_task = asyncio.create_task(flush_employees())
+
+async def flush_employees():
+    global unsaved_changes
+    # Loop so changes made while a write is in progress still get their own flush
+    while unsaved_changes:
+        await asyncio.sleep(FLUSH_DELAY_SECONDS)
+        unsaved_changes = False
+        # Snapshot on the event loop, write the file in a worker thread
+        data = orjson.dumps([emp.model_dump() for emp in employees_db.values()])
+        await asyncio.to_thread(write_employees, data)
+
+# Employees indexed by id for O(1) lookups
+employees_db: Dict[int, Employee] = {emp.id: emp for emp in load_employees()}
 
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+
+@app.on_event("shutdown")
+async def flush_on_shutdown():
+    # Wait for the pending flush so the last changes reach the file
+    if flush_task is not None and not flush_task.done():
+        await flush_task
+
+# Serialized GET responses, cached for a minute: {key: (expires_at, json_bytes)}.
+# Write handlers clear it right after changing employees_db, so reads never see stale data.
+CACHE_MAX_AGE = 60
+response_cache: Dict[object, tuple] = {}
+
+def cached_json(key, build):
+    entry = response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        entry = (time.monotonic() + CACHE_MAX_AGE, orjson.dumps(build()))
+        response_cache[key] = entry
+    return Response(content=entry[1], media_type='application/json')
 
 
 # 1. Read all employees
 @app.get('/employees', response_model=List[Employee])
-def get_employees():
-    return employees_db
+async def get_employees():
+    return cached_json('all', lambda: [emp.model_dump() for emp in employees_db.values()])
 
 
 # 2. Read specific employee
 @app.get('/employees/{emp_id}', response_model=Employee)
-def get_employee(emp_id: int):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            return employees_db[index]
-    raise HTTPException(status_code=404, detail='Employee Not Found')
+async def get_employee(emp_id: int):
+    employee = employees_db.get(emp_id)
+    if employee is None:
+        raise HTTPException(status_code=404, detail='Employee Not Found')
+    return cached_json(emp_id, employee.model_dump)
 
 
 # 3. Add an employee
 @app.post('/add_employee', response_model=Employee)
-def add_employee(new_emp: Employee):
-    for employee in employees_db:
-        if employee.id == new_emp.id:
-            raise HTTPException(status_code=400, detail='Employee already exists')
-    employees_db.append(new_emp)
-    save_employees(employees_db)
+async def add_employee(new_emp: Employee):
+    if new_emp.id in employees_db:
+        raise HTTPException(status_code=400, detail='Employee already exists')
+    employees_db[new_emp.id] = new_emp
+    response_cache.clear()
+    save_employees()
     return new_emp
 
 
 # 4. Update an employee
 @app.put('/update_employee/{emp_id}', response_model=Employee)
-def update_employee(emp_id: int, updated_employee: Employee):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            employees_db[index] = updated_employee
-            save_employees(employees_db)
-            return updated_employee
-    raise HTTPException(status_code=404, detail='Employee Not Found')
+async def update_employee(emp_id: int, updated_employee: Employee):
+    if emp_id not in employees_db:
+        raise HTTPException(status_code=404, detail='Employee Not Found')
+    if updated_employee.id != emp_id:
+        if updated_employee.id in employees_db:
+            raise HTTPException(status_code=400, detail='Employee already exists')
+        # Keep the index keyed by the id that gets saved to the file
+        del employees_db[emp_id]
+    employees_db[updated_employee.id] = updated_employee
+    response_cache.clear()
+    save_employees()
+    return updated_employee
 
 
 # 5. Delete an employee
 @app.delete('/delete_employee/{emp_id}')
-def delete_employee(emp_id: int):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            del employees_db[index]
-            save_employees(employees_db)
-            return {'message': 'Employee deleted successfully'}
-    raise HTTPException(status_code=404, detail='Employee Not Found')
+async def delete_employee(emp_id: int):
+    if emp_id not in employees_db:
+        raise HTTPException(status_code=404, detail='Employee Not Found')
+    del employees_db[emp_id]
+    response_cache.clear()
+    save_employees()
+    return {'message': 'Employee deleted successfully'}
@@ -1,10 +1,11 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # For each endpoint you create, you need to define a function that will be executed when that endpoint is called.
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Heyya!"}
 '''
 @app.get("/"): This is a decorator. In this context, it tells the application that the function directly below it should run when a user accesses the root URL (/) using an HTTP GET request.
@@ -25,4 +26,12 @@ Custom response types: For situations where you don't want a JSON response, Fast
 
 
 # To see in swagger UI: http://localhost:8000/docs
-# To see in redocly: http://localhost:8000/redoc
\ No newline at end of file
+# To see in redocly: http://localhost:8000/redoc
+
+
+'''
+Command to run the application (uvicorn[standard] installs uvloop + httptools):
+uvicorn main:app --reload --loop uvloop --http httptools
+With one worker per CPU core: uvicorn main:app --workers $(nproc) --loop uvloop --http httptools
+With gunicorn: gunicorn main:app -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1))
+'''